@@ -1,11 +1,107 @@
 import os
 import re
+import argparse
 import ast
 import json
+from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional
 import configparser
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; json.loads accepts bytes as well
+    _json_loads = json.loads
+
+# Directories never worth descending into when looking for project sources
+_SKIP_DIRS = frozenset({'__pycache__', 'node_modules', 'venv'})
+
+# Entry-point style functions that say nothing about what a project does
+_SKIP_FUNCS = frozenset({'main', 'run', 'setup', 'init'})
+
+# Code keywords mapped to the feature they suggest
+_FEATURE_INDICATORS = {
+    'export': 'Data export to multiple formats',
+    'import': 'Data import from various sources',
+    'csv': 'CSV file processing',
+    'json': 'JSON data handling',
+    'api': 'RESTful API integration',
+    'database': 'Database connectivity',
+    'threading': 'Multi-threaded processing',
+    'async': 'Asynchronous operations',
+    'logging': 'Comprehensive logging system',
+    'config': 'Configurable settings',
+    'cli': 'Command-line interface',
+    'gui': 'Graphical user interface',
+    'report': 'Report generation',
+    'scan': 'Network/system scanning',
+    'monitor': 'Real-time monitoring',
+    'visualization': 'Data visualization'
+}
+_FEATURE_RE = re.compile('|'.join(re.escape(k) for k in _FEATURE_INDICATORS))
+
+# Keys every saved analysis must contain to be reused as-is
+_INFO_KEYS = (
+    'description', 'features', 'run_command', 'additional_usage', 'install_notes',
+    'author_name', 'github_username', 'email', 'repo_name', 'license',
+    'has_screenshots', 'screenshot_note', 'acknowledgments'
+)
+
+# Directories checked for screenshots, relative to the project root
+_SCREENSHOT_DIRS = ('screenshots', 'images', 'docs/images', 'assets/images')
+
+# Requirements that need extra system setup
+_INSTALL_NOTES = {
+    'opencv': 'OpenCV system libraries required',
+    'psycopg2': 'PostgreSQL development headers needed',
+    'mysqlclient': 'MySQL development libraries required',
+    'scapy': 'May require root/admin privileges for network scanning'
+}
+
+# Upper bound on files inspected when inferring the project type from names
+_MAX_STRUCTURE_FILES = 2000
+
+# File extensions recognised as screenshots
+_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+
+# Patterns used while scanning project files, compiled once at import time
+_FUNC_RE = re.compile(r'def\s+([a-z_][a-z0-9_]*)\s*\(')
+_CLASS_RE = re.compile(r'class\s+([A-Z][a-zA-Z0-9]*)')
+_CAMEL_RE = re.compile(r'([A-Z])')
+_SETUP_DESC_RE = re.compile(r'description\s*=\s*["\']([^"\']+)["\']')
+_SETUP_AUTHOR_RE = re.compile(r'author\s*=\s*["\']([^"\']+)["\']')
+_SETUP_EMAIL_RE = re.compile(r'author_email\s*=\s*["\']([^"\']+)["\']')
+_GITHUB_USER_RE = re.compile(r'github\.com[:/]([^/\s]+)')
+_GIT_REPO_RE = re.compile(r'github\.com[:/][^/]+/([^/\s]+?)(?:\.git)?(?:\s|$)')
+
+# File-name keywords hinting at what kind of project this is
+_STRUCTURE_KEYWORDS = {
+    'web': frozenset({'flask', 'django', 'fastapi', 'app', 'server', 'api', 'route'}),
+    'data': frozenset({'data', 'analysis', 'pandas', 'numpy', 'visualization', 'plot'}),
+    'ml': frozenset({'model', 'train', 'predict', 'neural', 'learning', 'ai'}),
+    'automation': frozenset({'script', 'automate', 'bot', 'scrape', 'crawler'}),
+    'network': frozenset({'network', 'scan', 'socket', 'connection', 'ping'}),
+    'gui': frozenset({'gui', 'tkinter', 'qt', 'window', 'interface'}),
+    'cli': frozenset({'cli', 'command', 'terminal', 'argparse'}),
+    'game': frozenset({'game', 'player', 'score', 'pygame'}),
+    'security': frozenset({'security', 'encrypt', 'decrypt', 'hash', 'auth'})
+}
+
+
+@dataclass
+class FileAnalysis:
+    """Content and parsed definitions of a main project file."""
+    path: Path
+    content: str
+    tree: Optional[ast.Module] = None
+    docstring: Optional[str] = None
+    public_funcs: List[str] = field(default_factory=list)
+    classes: List[str] = field(default_factory=list)
+
+
 class AutoReadmeInfoGenerator:
     """
     Automatically generates README information by analyzing project code and files.
@@ -16,9 +112,25 @@ class AutoReadmeInfoGenerator:
         self.project_path = Path(project_path).resolve()
         self.project_name = self.project_path.name
         self.analysis = {}
+        self._main_files_cache = None
+        self._file_cache: Dict[Path, tuple] = {}
+        self._py_file_names_cache: Optional[List[str]] = None
+        self._main_analysis_cache: Optional[List[FileAnalysis]] = None
+        self._root_entries: Optional[Dict[str, os.DirEntry]] = None
+        
+    def analyze_project(self, force_refresh: bool = False) -> Dict:
+        """
+        Main analysis function that gathers all project information.
+        
+        Args:
+            force_refresh: Re-analyze even if an up-to-date readme_info.json exists
+        """
+        if not force_refresh:
+            cached = self._load_cached_info()
+            if cached is not None:
+                print("\n⚡ Using up-to-date analysis from readme_info.json")
+                return cached
         
-    def analyze_project(self) -> Dict:
-        """Main analysis function that gathers all project information."""
         print("\n🔍 Analyzing project automatically...")
         
         info = {
@@ -39,17 +151,174 @@ class AutoReadmeInfoGenerator:
         
         return info
     
+    def _load_cached_info(self, info_file: str = 'readme_info.json') -> Optional[Dict]:
+        """Return a previously saved analysis if no input changed since it was written."""
+        entry = self._scan_root().get(info_file)
+        if entry is None or not entry.is_file():
+            return None
+        
+        try:
+            saved_at = entry.stat().st_mtime_ns
+            if any(mtime > saved_at for mtime in self._input_mtimes(info_file)):
+                return None
+            
+            with open(entry.path, 'rb') as f:
+                info = _json_loads(f.read())
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return None
+        
+        if not isinstance(info, dict) or not all(key in info for key in _INFO_KEYS):
+            return None
+        return info
+    
+    def _input_mtimes(self, info_file: str) -> Iterator[int]:
+        """
+        Lazily yield the mtime_ns of everything the detectors look at.
+        Directory mtimes stand in for the names they list, so added, removed
+        and renamed files count as changes too. Subdirectories are only
+        checked when the description had to be inferred from file names.
+        """
+        # Root listing and every root file (license, readme, Docker/.env, scripts...)
+        yield os.stat(self.project_path).st_mtime_ns
+        for entry in self._scan_root().values():
+            if entry.name != info_file and entry.is_file():
+                yield entry.stat().st_mtime_ns
+        
+        # Git identity and remotes
+        git_config = self._git_config_path()
+        if git_config:
+            for path in (git_config, git_config.with_name('HEAD')):
+                try:
+                    yield path.stat().st_mtime_ns
+                except OSError:
+                    continue
+        
+        # Screenshot folders
+        for dir_name in _SCREENSHOT_DIRS:
+            try:
+                yield (self.project_path / dir_name).stat().st_mtime_ns
+            except OSError:
+                continue
+        
+        # The root files above are unchanged by now, so the description sources
+        # are too; file names only matter if the description was inferred from them
+        if self._description_sources:
+            return
+        
+        # Directories _infer_from_structure read, up to where it stops reading names
+        py_files = 0
+        pending = [str(self.project_path)]
+        while pending and py_files < _MAX_STRUCTURE_FILES:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+                if current != str(self.project_path):
+                    yield os.stat(current).st_mtime_ns
+            except OSError:
+                continue
+            
+            for entry in entries:
+                if entry.name.startswith('.') or entry.name in _SKIP_DIRS:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    py_files += 1
+    
     def _read_file_safe(self, filepath: Path, max_lines: int = 500) -> str:
-        """Safely read file content."""
+        """
+        Safely read file content. The longest prefix read so far is cached per
+        path, and shorter requests are sliced from it.
+        """
+        cached = self._file_cache.get(filepath)
+        if cached is not None:
+            lines, limit = cached
+            # A prefix shorter than its limit is the whole file
+            if max_lines <= limit or len(lines) < limit:
+                return ''.join(lines[:max_lines])
+        
         try:
             with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = [next(f) for _ in range(max_lines) if f]
-                return ''.join(lines)
-        except:
-            return ""
+                lines = list(islice(f, max_lines))
+        except (OSError, UnicodeDecodeError):
+            lines = []
+        
+        self._file_cache[filepath] = (lines, max_lines)
+        return ''.join(lines)
+    
+    def _scan_root(self) -> Dict[str, os.DirEntry]:
+        """List the project root once, keyed by entry name."""
+        if self._root_entries is None:
+            try:
+                with os.scandir(self.project_path) as it:
+                    self._root_entries = {entry.name: entry for entry in it}
+            except OSError:
+                self._root_entries = {}
+        return self._root_entries
+    
+    def _root_file(self, name: str) -> Optional[Path]:
+        """Return the path of a file in the project root, or None if absent."""
+        entry = self._scan_root().get(name)
+        if entry is not None and entry.is_file():
+            return Path(entry.path)
+        return None
+    
+    def _git_config_path(self) -> Optional[Path]:
+        """Return the path of .git/config if the project is a git checkout."""
+        entry = self._scan_root().get('.git')
+        if entry is not None and entry.is_dir():
+            return Path(entry.path) / 'config'
+        return None
+    
+    @cached_property
+    def _git_config(self) -> Optional[configparser.ConfigParser]:
+        """Parsed .git/config, loaded on first access."""
+        git_config = self._git_config_path()
+        if git_config:
+            try:
+                config = configparser.ConfigParser(strict=False, interpolation=None, allow_no_value=True)
+                config.read(git_config, encoding='utf-8')
+                return config
+            except (configparser.Error, OSError, UnicodeDecodeError):
+                pass
+        return None
+    
+    def _git_remote_urls(self) -> List[str]:
+        """Return the URLs of all remotes configured in .git/config."""
+        config = self._git_config
+        if config is None:
+            return []
+        return [config[section]['url'] for section in config.sections()
+                if section.startswith('remote ') and config[section].get('url')]
+    
+    @cached_property
+    def _package_json(self) -> Optional[Dict]:
+        """Parsed package.json, loaded on first access."""
+        package_json = self._root_file('package.json')
+        if package_json:
+            try:
+                with open(package_json, 'rb') as f:
+                    data = _json_loads(f.read())
+                    if isinstance(data, dict):
+                        return data
+            except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+                pass
+        return None
+    
+    @cached_property
+    def _setup_py_content(self) -> Optional[str]:
+        """Content of setup.py, read on first access."""
+        setup_py = self._root_file('setup.py')
+        if setup_py:
+            return self._read_file_safe(setup_py)
+        return None
     
     def _find_main_files(self) -> List[Path]:
         """Find main Python files in the project."""
+        if self._main_files_cache is not None:
+            return self._main_files_cache
+        
         main_files = []
         
         # Priority patterns for main files
@@ -59,25 +328,108 @@ class AutoReadmeInfoGenerator:
         ]
         
         for pattern in priority_patterns:
-            found = list(self.project_path.glob(pattern))
+            found = self._root_file(pattern)
             if found:
-                main_files.extend(found)
+                main_files.append(found)
         
         # If no main files found, get all .py files
         if not main_files:
-            main_files = [f for f in self.project_path.glob('*.py') 
-                         if not f.name.startswith('_') and f.name != 'setup.py'][:5]
+            main_files = [Path(e.path) for e in self._scan_root().values()
+                         if e.name.endswith('.py') and not e.name.startswith('_')
+                         and e.name != 'setup.py'][:5]
         
+        self._main_files_cache = main_files
         return main_files
     
+    def _analyze_main_files(self) -> List[FileAnalysis]:
+        """Read and parse each main file once, collecting docstring, functions and classes."""
+        if self._main_analysis_cache is not None:
+            return self._main_analysis_cache
+        
+        analyses = []
+        for py_file in self._find_main_files():
+            analysis = FileAnalysis(path=py_file, content=self._read_file_safe(py_file))
+            
+            try:
+                analysis.tree = ast.parse(analysis.content)
+            except (SyntaxError, ValueError):
+                analysis.tree = None
+            
+            if analysis.tree is not None:
+                analysis.docstring = ast.get_docstring(analysis.tree)
+                
+                # Only module-level definitions describe what the file offers
+                functions, classes = [], []
+                for node in analysis.tree.body:
+                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        functions.append(node.name)
+                    elif isinstance(node, ast.ClassDef):
+                        classes.append(node.name)
+            else:
+                # Truncated or invalid source: fall back to a textual scan
+                functions = _FUNC_RE.findall(analysis.content)
+                classes = _CLASS_RE.findall(analysis.content)
+            
+            # Filter out private functions and common ones
+            analysis.public_funcs = [f for f in functions
+                                     if not f.startswith('_')
+                                     and f not in _SKIP_FUNCS]
+            analysis.classes = classes
+            analyses.append(analysis)
+        
+        self._main_analysis_cache = analyses
+        return analyses
+    
+    @cached_property
+    def _main_files_lower_blob(self) -> str:
+        """Lowercased content of all main files, joined once for keyword scans."""
+        return ' '.join(analysis.content for analysis in self._analyze_main_files()).lower()
+    
+    def _iter_py_file_names(self) -> Iterator[str]:
+        """
+        Lazily yield the names of .py files, skipping hidden and vendored directories.
+        The full list is cached once a walk runs to completion.
+        """
+        if self._py_file_names_cache is not None:
+            yield from self._py_file_names_cache
+            return
+        
+        names = []
+        pending = [str(self.project_path)]
+        
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            for entry in entries:
+                if entry.name.startswith('.') or entry.name in _SKIP_DIRS:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    names.append(entry.name)
+                    yield entry.name
+        
+        self._py_file_names_cache = names
+    
     def _generate_description(self) -> str:
         """Generate project description from docstrings, comments, and filenames."""
+        # Analyze project name and files only when nothing else describes the project
+        description_sources = self._description_sources
+        return description_sources[0] if description_sources else self._infer_from_structure()
+    
+    @cached_property
+    def _description_sources(self) -> List[str]:
+        """Descriptions found in root files: README, main-file docstrings, package.json, setup.py."""
         description_sources = []
         
         # Check for existing README
         for readme in ['README.md', 'README.txt', 'readme.md']:
-            readme_path = self.project_path / readme
-            if readme_path.exists():
+            readme_path = self._root_file(readme)
+            if readme_path:
                 content = self._read_file_safe(readme_path, 20)
                 # Extract first meaningful paragraph
                 lines = [l.strip() for l in content.split('\n') if l.strip() and not l.startswith('#')]
@@ -85,73 +437,61 @@ class AutoReadmeInfoGenerator:
                     description_sources.append(lines[0][:200])
         
         # Check main Python files for module docstrings
-        for py_file in self._find_main_files():
-            content = self._read_file_safe(py_file, 50)
-            
+        for analysis in self._analyze_main_files():
             # Extract module docstring
-            try:
-                tree = ast.parse(content)
-                docstring = ast.get_docstring(tree)
-                if docstring:
+            if analysis.tree is not None:
+                if analysis.docstring:
                     # Get first sentence or two
-                    sentences = docstring.split('.')[:2]
+                    sentences = analysis.docstring.split('.')[:2]
                     desc = '. '.join(s.strip() for s in sentences if s.strip()) + '.'
                     description_sources.append(desc)
-            except:
-                # Fallback: look for triple-quoted strings at the start
-                match = re.search(r'^["\'{3}](.*?)["\'{3}]', content, re.MULTILINE | re.DOTALL)
-                if match:
-                    desc = match.group(1).strip().split('\n')[0]
-                    description_sources.append(desc)
+            else:
+                # Fallback: look for a triple-quoted string at the start
+                stripped = analysis.content.lstrip()
+                for quote in ('"""', "'''"):
+                    if stripped.startswith(quote):
+                        docstring, _, _ = stripped[3:].partition(quote)
+                        desc = docstring.strip().split('\n')[0]
+                        if desc:
+                            description_sources.append(desc)
+                        break
         
         # Check package.json description
-        package_json = self.project_path / 'package.json'
-        if package_json.exists():
-            try:
-                with open(package_json, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'description' in data:
-                        description_sources.append(data['description'])
-            except:
-                pass
+        data = self._package_json
+        if data and 'description' in data:
+            description_sources.append(data['description'])
         
         # Check setup.py
-        setup_py = self.project_path / 'setup.py'
-        if setup_py.exists():
-            content = self._read_file_safe(setup_py)
-            match = re.search(r'description\s*=\s*["\']([^"\']+)["\']', content)
+        content = self._setup_py_content
+        if content is not None:
+            match = _SETUP_DESC_RE.search(content)
             if match:
                 description_sources.append(match.group(1))
         
-        # Analyze project name and files to generate description
-        if not description_sources:
-            description_sources.append(self._infer_from_structure())
-        
-        # Return the best description
-        return description_sources[0] if description_sources else f"A {self.project_name} project"
+        return description_sources
     
     def _infer_from_structure(self) -> str:
         """Infer project purpose from structure and filenames."""
-        files = [f.name.lower() for f in self.project_path.rglob('*.py') if f.is_file()]
-        
-        keywords = {
-            'web': ['flask', 'django', 'fastapi', 'app', 'server', 'api', 'route'],
-            'data': ['data', 'analysis', 'pandas', 'numpy', 'visualization', 'plot'],
-            'ml': ['model', 'train', 'predict', 'neural', 'learning', 'ai'],
-            'automation': ['script', 'automate', 'bot', 'scrape', 'crawler'],
-            'network': ['network', 'scan', 'socket', 'connection', 'ping'],
-            'gui': ['gui', 'tkinter', 'qt', 'window', 'interface'],
-            'cli': ['cli', 'command', 'terminal', 'argparse'],
-            'game': ['game', 'player', 'score', 'pygame'],
-            'security': ['security', 'encrypt', 'decrypt', 'hash', 'auth']
-        }
+        pending = dict(_STRUCTURE_KEYWORDS)
+        matched = set()
+        has_scan = False
+        
+        # Stop walking once every category (and 'scan') has been seen
+        for count, name in enumerate(self._iter_py_file_names(), 1):
+            # Substring probes so 'port_scanner' hits 'scan' and 'trainmodel' hits 'train'
+            stem = name.lower()[:-3]
+            
+            has_scan = has_scan or 'scan' in stem
+            for category in [c for c, terms in pending.items() if any(term in stem for term in terms)]:
+                matched.add(category)
+                del pending[category]
+            
+            if (not pending and has_scan) or count >= _MAX_STRUCTURE_FILES:
+                break
         
-        detected = []
-        for category, terms in keywords.items():
-            if any(term in ' '.join(files) for term in terms):
-                detected.append(category)
+        detected = [category for category in _STRUCTURE_KEYWORDS if category in matched]
         
-        if 'network' in detected and 'scan' in ' '.join(files):
+        if 'network' in detected and has_scan:
             return "A network scanning and analysis tool"
         elif 'web' in detected:
             return "A web application built with modern frameworks"
@@ -169,63 +509,36 @@ class AutoReadmeInfoGenerator:
     def _extract_features(self) -> List[str]:
         """Extract features from code analysis."""
         features = []
+        seen = set()
+        
+        def add(feature: str):
+            if feature not in seen:
+                seen.add(feature)
+                features.append(feature)
         
         # Analyze main Python files
-        for py_file in self._find_main_files():
-            content = self._read_file_safe(py_file)
-            
-            # Look for function definitions (potential features)
-            func_pattern = r'def\s+([a-z_][a-z0-9_]*)\s*\('
-            functions = re.findall(func_pattern, content)
-            
-            # Filter out private functions and common ones
-            public_funcs = [f for f in functions 
-                          if not f.startswith('_') 
-                          and f not in ['main', 'run', 'setup', 'init']]
-            
+        analyses = self._analyze_main_files()
+        for analysis in analyses:
             # Convert function names to features
-            for func in public_funcs[:5]:
+            for func in analysis.public_funcs[:5]:
                 # Convert snake_case to readable text
                 readable = func.replace('_', ' ').title()
-                features.append(readable)
+                add(readable)
         
         # Look for class definitions
-        for py_file in self._find_main_files():
-            content = self._read_file_safe(py_file)
-            class_pattern = r'class\s+([A-Z][a-zA-Z0-9]*)'
-            classes = re.findall(class_pattern, content)
-            
-            for cls in classes[:3]:
+        for analysis in analyses:
+            for cls in analysis.classes[:3]:
                 # Convert class name to feature
                 # CamelCase to readable
-                readable = re.sub(r'([A-Z])', r' \1', cls).strip()
-                features.append(f"{readable} implementation")
+                readable = _CAMEL_RE.sub(r' \1', cls).strip()
+                add(f"{readable} implementation")
         
         # Check for specific patterns in code
-        all_content = ' '.join(self._read_file_safe(f) for f in self._find_main_files())
-        
-        feature_indicators = {
-            'export': 'Data export to multiple formats',
-            'import': 'Data import from various sources',
-            'csv': 'CSV file processing',
-            'json': 'JSON data handling',
-            'api': 'RESTful API integration',
-            'database': 'Database connectivity',
-            'threading': 'Multi-threaded processing',
-            'async': 'Asynchronous operations',
-            'logging': 'Comprehensive logging system',
-            'config': 'Configurable settings',
-            'cli': 'Command-line interface',
-            'gui': 'Graphical user interface',
-            'report': 'Report generation',
-            'scan': 'Network/system scanning',
-            'monitor': 'Real-time monitoring',
-            'visualization': 'Data visualization'
-        }
+        found = set(_FEATURE_RE.findall(self._main_files_lower_blob))
         
-        for keyword, feature in feature_indicators.items():
-            if keyword in all_content.lower() and feature not in features:
-                features.append(feature)
+        for keyword, feature in _FEATURE_INDICATORS.items():
+            if keyword in found:
+                add(feature)
         
         # If no features found, add generic ones
         if not features:
@@ -241,35 +554,31 @@ class AutoReadmeInfoGenerator:
         """Detect the command to run the project."""
         
         # Check for package.json scripts
-        package_json = self.project_path / 'package.json'
-        if package_json.exists():
-            try:
-                with open(package_json, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'scripts' in data:
-                        if 'start' in data['scripts']:
-                            return 'npm start'
-                        elif 'dev' in data['scripts']:
-                            return 'npm run dev'
-            except:
-                pass
+        data = self._package_json
+        if data and isinstance(data.get('scripts'), dict):
+            if 'start' in data['scripts']:
+                return 'npm start'
+            elif 'dev' in data['scripts']:
+                return 'npm run dev'
         
         # Check for Python main files
         main_patterns = ['main.py', 'app.py', 'run.py', '__main__.py', 'manage.py']
         for pattern in main_patterns:
-            if (self.project_path / pattern).exists():
+            if pattern in self._scan_root():
                 if pattern == 'manage.py':
                     return 'python manage.py runserver'
                 return f'python {pattern}'
         
         # Check if any Python file has __main__ block
-        for py_file in self.project_path.glob('*.py'):
-            content = self._read_file_safe(py_file, 100)
+        for entry in self._scan_root().values():
+            if not entry.name.endswith('.py'):
+                continue
+            content = self._read_file_safe(Path(entry.path), 100)
             if 'if __name__' in content:
-                return f'python {py_file.name}'
+                return f'python {entry.name}'
         
         # Check for setup.py (installable package)
-        if (self.project_path / 'setup.py').exists():
+        if 'setup.py' in self._scan_root():
             return 'python setup.py install && ' + self.project_name.lower()
         
         return 'python main.py  # Adjust as needed'
@@ -279,8 +588,8 @@ class AutoReadmeInfoGenerator:
         usage_info = []
         
         # Check for argparse or click usage
-        for py_file in self._find_main_files():
-            content = self._read_file_safe(py_file)
+        for analysis in self._analyze_main_files():
+            content = analysis.content
             
             if 'argparse' in content or 'ArgumentParser' in content:
                 usage_info.append("Run with --help to see all available options")
@@ -299,26 +608,20 @@ class AutoReadmeInfoGenerator:
         notes = []
         
         # Check requirements.txt for system dependencies
-        req_file = self.project_path / 'requirements.txt'
-        if req_file.exists():
-            content = self._read_file_safe(req_file)
+        req_file = self._root_file('requirements.txt')
+        if req_file:
+            content = self._read_file_safe(req_file).lower()
             
-            if 'opencv' in content.lower():
-                notes.append("OpenCV system libraries required")
-            if 'psycopg2' in content.lower():
-                notes.append("PostgreSQL development headers needed")
-            if 'mysqlclient' in content.lower():
-                notes.append("MySQL development libraries required")
-            if 'scapy' in content.lower():
-                notes.append("May require root/admin privileges for network scanning")
+            for package, note in _INSTALL_NOTES.items():
+                if package in content:
+                    notes.append(note)
         
         # Check for Docker
-        if (self.project_path / 'Dockerfile').exists():
+        if 'Dockerfile' in self._scan_root():
             notes.append("Docker available for containerized deployment")
         
         # Check for environment variables
-        env_example = self.project_path / '.env.example'
-        if env_example.exists() or (self.project_path / '.env').exists():
+        if '.env.example' in self._scan_root() or '.env' in self._scan_root():
             notes.append("Copy .env.example to .env and configure environment variables")
         
         return ' | '.join(notes) if notes else ''
@@ -327,58 +630,35 @@ class AutoReadmeInfoGenerator:
         """Detect author name from git config or setup.py."""
         
         # Check git config
-        git_config = self.project_path / '.git' / 'config'
-        if git_config.exists():
-            try:
-                config = configparser.ConfigParser()
-                config.read(git_config)
-                if 'user' in config and 'name' in config['user']:
-                    return config['user']['name']
-            except:
-                pass
+        config = self._git_config
+        if config and 'user' in config and config['user'].get('name'):
+            return config['user']['name']
         
         # Check setup.py
-        setup_py = self.project_path / 'setup.py'
-        if setup_py.exists():
-            content = self._read_file_safe(setup_py)
-            match = re.search(r'author\s*=\s*["\']([^"\']+)["\']', content)
+        content = self._setup_py_content
+        if content is not None:
+            match = _SETUP_AUTHOR_RE.search(content)
             if match:
                 return match.group(1)
         
         # Check package.json
-        package_json = self.project_path / 'package.json'
-        if package_json.exists():
-            try:
-                with open(package_json, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'author' in data:
-                        if isinstance(data['author'], str):
-                            return data['author']
-                        elif isinstance(data['author'], dict):
-                            return data['author'].get('name', '')
-            except:
-                pass
+        data = self._package_json
+        if data and 'author' in data:
+            if isinstance(data['author'], str):
+                return data['author']
+            elif isinstance(data['author'], dict):
+                return data['author'].get('name', '')
         
         return os.getenv('USER', os.getenv('USERNAME', 'Your Name'))
     
     def _detect_github_username(self) -> str:
         """Detect GitHub username from git remote."""
         
-        git_config = self.project_path / '.git' / 'config'
-        if git_config.exists():
-            content = self._read_file_safe(git_config)
-            
-            # Look for GitHub remote URL
-            patterns = [
-                r'github\.com[:/]([^/]+)/',
-                r'url\s*=\s*https://github\.com/([^/]+)',
-                r'url\s*=\s*git@github\.com:([^/]+)'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, content)
-                if match:
-                    return match.group(1)
+        # Look for GitHub remote URL
+        for url in self._git_remote_urls():
+            match = _GITHUB_USER_RE.search(url)
+            if match:
+                return match.group(1)
         
         return 'yourusername'
     
@@ -386,46 +666,30 @@ class AutoReadmeInfoGenerator:
         """Detect email from git config or setup.py."""
         
         # Check git config
-        git_config = self.project_path / '.git' / 'config'
-        if git_config.exists():
-            try:
-                config = configparser.ConfigParser()
-                config.read(git_config)
-                if 'user' in config and 'email' in config['user']:
-                    return config['user']['email']
-            except:
-                pass
+        config = self._git_config
+        if config and 'user' in config and config['user'].get('email'):
+            return config['user']['email']
         
         # Check setup.py
-        setup_py = self.project_path / 'setup.py'
-        if setup_py.exists():
-            content = self._read_file_safe(setup_py)
-            match = re.search(r'author_email\s*=\s*["\']([^"\']+)["\']', content)
+        content = self._setup_py_content
+        if content is not None:
+            match = _SETUP_EMAIL_RE.search(content)
             if match:
                 return match.group(1)
         
         # Check package.json
-        package_json = self.project_path / 'package.json'
-        if package_json.exists():
-            try:
-                with open(package_json, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'author' in data and isinstance(data['author'], dict):
-                        return data['author'].get('email', '')
-            except:
-                pass
+        data = self._package_json
+        if data and isinstance(data.get('author'), dict):
+            return data['author'].get('email', '')
         
         return ''
     
     def _detect_repo_name(self) -> str:
         """Detect repository name from git remote or project name."""
         
-        git_config = self.project_path / '.git' / 'config'
-        if git_config.exists():
-            content = self._read_file_safe(git_config)
-            
-            # Extract repo name from URL
-            match = re.search(r'github\.com[:/][^/]+/([^/\s]+?)(?:\.git)?(?:\s|$)', content)
+        # Extract repo name from URL
+        for url in self._git_remote_urls():
+            match = _GIT_REPO_RE.search(url)
             if match:
                 return match.group(1)
         
@@ -437,8 +701,8 @@ class AutoReadmeInfoGenerator:
         license_files = ['LICENSE', 'LICENSE.txt', 'LICENSE.md', 'license', 'license.txt']
         
         for lic_file in license_files:
-            lic_path = self.project_path / lic_file
-            if lic_path.exists():
+            lic_path = self._root_file(lic_file)
+            if lic_path:
                 content = self._read_file_safe(lic_path, 20).lower()
                 
                 if 'mit license' in content:
@@ -458,15 +722,16 @@ class AutoReadmeInfoGenerator:
     def _detect_screenshots(self) -> bool:
         """Check if screenshots directory exists."""
         
-        screenshot_dirs = ['screenshots', 'images', 'docs/images', 'assets/images']
-        
-        for dir_name in screenshot_dirs:
+        for dir_name in _SCREENSHOT_DIRS:
             dir_path = self.project_path / dir_name
-            if dir_path.exists() and dir_path.is_dir():
-                # Check for image files
-                image_files = list(dir_path.glob('*.png')) + list(dir_path.glob('*.jpg'))
-                if image_files:
-                    return True
+            try:
+                # Stop at the first image file
+                with os.scandir(dir_path) as it:
+                    if any(entry.name.lower().endswith(_IMAGE_EXTENSIONS)
+                           for entry in it if entry.is_file(follow_symlinks=False)):
+                        return True
+            except OSError:
+                continue
         
         return False
     
@@ -476,8 +741,8 @@ class AutoReadmeInfoGenerator:
         acks = []
         
         # Check requirements.txt for major frameworks
-        req_file = self.project_path / 'requirements.txt'
-        if req_file.exists():
+        req_file = self._root_file('requirements.txt')
+        if req_file:
             content = self._read_file_safe(req_file).lower()
             
             frameworks = {
@@ -496,21 +761,16 @@ class AutoReadmeInfoGenerator:
                     acks.append(f"Built with {name}")
         
         # Check package.json
-        package_json = self.project_path / 'package.json'
-        if package_json.exists():
-            try:
-                with open(package_json, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    deps = data.get('dependencies', {})
-                    
-                    if 'react' in deps:
-                        acks.append("Built with React")
-                    if 'vue' in deps:
-                        acks.append("Built with Vue.js")
-                    if 'express' in deps:
-                        acks.append("Powered by Express.js")
-            except:
-                pass
+        data = self._package_json
+        if data:
+            deps = data.get('dependencies') or {}
+            
+            if 'react' in deps:
+                acks.append("Built with React")
+            if 'vue' in deps:
+                acks.append("Built with Vue.js")
+            if 'express' in deps:
+                acks.append("Powered by Express.js")
         
         return ' • '.join(acks) if acks else ''
     
@@ -572,8 +832,19 @@ class AutoReadmeInfoGenerator:
         print("\n" + "=" * 70)
 
 
-def main():
-    """Main function to run the auto-generator."""
+def main(project_path: Optional[str] = None, auto_confirm: bool = False,
+         force_refresh: bool = False) -> Optional[Dict]:
+    """
+    Main function to run the auto-generator.
+    
+    Args:
+        project_path: Project folder to analyze; asked for interactively when omitted
+        auto_confirm: Save readme_info.json without asking
+        force_refresh: Re-analyze even if an up-to-date readme_info.json exists
+    
+    Returns:
+        dict: The generated information, or None if no project was given
+    """
     print("\n" + "=" * 70)
     print("🤖 AUTOMATIC README INFO GENERATOR".center(70))
     print("=" * 70)
@@ -587,7 +858,10 @@ def main():
     print("  • Generate comprehensive project information")
     print("\n" + "-" * 70)
     
-    project_folder = input("\n📂 Enter the path to your project folder: ").strip()
+    if project_path is None:
+        project_folder = input("\n📂 Enter the path to your project folder: ").strip()
+    else:
+        project_folder = str(project_path)
     
     if not project_folder:
         print("❌ No path provided. Exiting.")
@@ -600,13 +874,16 @@ def main():
     generator = AutoReadmeInfoGenerator(project_folder)
     
     # Analyze project
-    info = generator.analyze_project()
+    info = generator.analyze_project(force_refresh=force_refresh)
     
     # Display summary
     generator.display_summary(info)
     
     # Ask to save
-    save = input("\n💾 Save this information to readme_info.json? (Y/n): ").strip().lower()
+    if auto_confirm:
+        save = 'y'
+    else:
+        save = input("\n💾 Save this information to readme_info.json? (Y/n): ").strip().lower()
     if save != 'n':
         generator.save_to_file(info)
         print("\n💡 You can now:")
@@ -615,7 +892,12 @@ def main():
         print("  3. Or manually use the information above")
     
     print("\n🎉 Done!\n")
+    return info
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Collect README information from a project.")
+    parser.add_argument('--refresh', action='store_true',
+                        help="re-analyze even if readme_info.json is up to date")
+    args = parser.parse_args()
+    main(force_refresh=args.refresh)
\ No newline at end of file
@@ -1,9 +1,160 @@
 import os
+import sys
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Set, Optional
+from typing import Callable, Dict, List, Optional
 import re
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; json.loads accepts bytes as well
+    _json_loads = json.loads
+
+# Directories skipped entirely while walking a project
+IGNORE_DIRS = frozenset({
+    '.git', 'node_modules', '__pycache__', 'venv', '.venv',
+    'dist', 'build', 'target', '.idea', '.vscode', 'coverage'
+})
+
+# Enhanced language detection
+LANGUAGE_MAP = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.jsx': 'React (JSX)',
+    '.tsx': 'React (TypeScript)',
+    '.java': 'Java',
+    '.cpp': 'C++',
+    '.c': 'C',
+    '.h': 'C/C++ Header',
+    '.cs': 'C#',
+    '.php': 'PHP',
+    '.rb': 'Ruby',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.swift': 'Swift',
+    '.kt': 'Kotlin',
+    '.scala': 'Scala',
+    '.r': 'R',
+    '.m': 'MATLAB/Objective-C',
+    '.lua': 'Lua',
+    '.pl': 'Perl',
+    '.sh': 'Shell Script',
+    '.bash': 'Bash',
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.scss': 'SCSS',
+    '.sass': 'Sass',
+    '.less': 'Less',
+    '.sql': 'SQL',
+    '.vue': 'Vue.js',
+    '.svelte': 'Svelte',
+    '.dart': 'Dart',
+    '.xml': 'XML',
+    '.json': 'JSON',
+    '.yaml': 'YAML',
+    '.yml': 'YAML',
+    '.md': 'Markdown',
+    '.tex': 'LaTeX'
+}
+
+# Comprehensive dependency/config files
+DEPENDENCY_FILES = {
+    'requirements.txt': 'Python',
+    'setup.py': 'Python',
+    'pyproject.toml': 'Python',
+    'Pipfile': 'Python',
+    'environment.yml': 'Conda',
+    'package.json': 'Node.js',
+    'package-lock.json': 'Node.js',
+    'yarn.lock': 'Yarn',
+    'pnpm-lock.yaml': 'pnpm',
+    'Gemfile': 'Ruby',
+    'Gemfile.lock': 'Ruby',
+    'pom.xml': 'Maven (Java)',
+    'build.gradle': 'Gradle (Java)',
+    'Cargo.toml': 'Rust',
+    'go.mod': 'Go',
+    'go.sum': 'Go',
+    'composer.json': 'PHP',
+    'Podfile': 'iOS/CocoaPods',
+    'pubspec.yaml': 'Dart/Flutter'
+}
+
+CONFIG_FILES = frozenset({
+    '.gitignore', '.dockerignore', 'Dockerfile', 'docker-compose.yml',
+    '.env.example', '.eslintrc', '.prettierrc', 'tsconfig.json',
+    'webpack.config.js', 'vite.config.js', '.babelrc', 'jest.config.js',
+    'pytest.ini', 'tox.ini', '.flake8', 'mypy.ini', 'setup.cfg'
+})
+
+# Dependency and config file names mapped to (kind, tech) for a single lookup per file
+_SPECIAL_NAMES = {name: ('dep', tech) for name, tech in DEPENDENCY_FILES.items()}
+_SPECIAL_NAMES.update((name, ('cfg', None)) for name in CONFIG_FILES)
+
+# Extensions whose line counts contribute to total_lines
+_COUNTABLE_EXTS = frozenset({
+    '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.c', '.cpp', '.h', '.cs',
+    '.go', '.rs', '.rb', '.php', '.md', '.rst', '.txt', '.html', '.css', '.scss',
+    '.yaml', '.yml', '.json', '.sh', '.vue', '.svelte'
+})
+
+# Files larger than this are almost always generated or minified
+_MAX_COUNT_BYTES = 2 * 1024 * 1024
+
+# Below this many files, counting lines serially beats starting a thread pool
+_PARALLEL_COUNT_MIN_FILES = 256
+
+# Files counted per thread-pool task, to keep dispatch overhead low
+_COUNT_BATCH_SIZE = 64
+
+# Dependency declarations, matched one line at a time by extract_dependencies
+_CARGO_DEP_RE = re.compile(r'^(\w+)\s*=')
+_PYPROJECT_DEP_RE = re.compile(r'([a-zA-Z0-9_-]+)\s*[=~>]')
+_REQUIRE_DEP_RE = re.compile(r'^\s*(?:gem|require)\s+["\']([^"\']+)')
+
+# Timestamped output files (e.g. scan_20240101_120000.csv) left out of the structure
+_OUTPUT_FILE_RE = re.compile(r'_\d{8}_\d{6}\.(?:csv|json|txt)\Z')
+
+# Extensions eligible for README code samples, in order of preference
+_SAMPLE_EXTENSIONS = {ext: rank for rank, ext in enumerate((
+    '.py', '.js', '.jsx', '.ts', '.tsx', '.java', '.cpp',
+    '.c', '.go', '.rs', '.rb', '.php', '.vue', '.swift'
+))}
+
+# File stems that usually hold a project's entry point
+_SAMPLE_PRIORITY_STEMS = frozenset({'main', 'index', 'app'})
+
+
+def _count_lines(path: str) -> int:
+    """Count lines in a file by scanning raw bytes in large chunks."""
+    lines = 0
+    last = b''
+    try:
+        with open(path, 'rb', buffering=0) as f:
+            while True:
+                chunk = f.read(1 << 20)
+                if not chunk:
+                    break
+                lines += chunk.count(b'\n')
+                last = chunk
+    except OSError:
+        return 0
+    
+    # A final line without a trailing newline still counts
+    if last and not last.endswith(b'\n'):
+        lines += 1
+    return lines
+
+
+def _count_lines_batch(paths: List[str]) -> int:
+    """Total line count of several files; one thread-pool task per batch."""
+    return sum(_count_lines(path) for path in paths)
+
 
 def analyze_project_structure(project_path: Path) -> Dict:
     """
@@ -27,249 +178,226 @@ def analyze_project_structure(project_path: Path) -> Dict:
         'structure': [],
         'config_files': [],
         'test_files': 0,
-        'doc_files': []
-    }
-    
-    # Enhanced language detection
-    language_map = {
-        '.py': 'Python',
-        '.js': 'JavaScript',
-        '.ts': 'TypeScript',
-        '.jsx': 'React (JSX)',
-        '.tsx': 'React (TypeScript)',
-        '.java': 'Java',
-        '.cpp': 'C++',
-        '.c': 'C',
-        '.h': 'C/C++ Header',
-        '.cs': 'C#',
-        '.php': 'PHP',
-        '.rb': 'Ruby',
-        '.go': 'Go',
-        '.rs': 'Rust',
-        '.swift': 'Swift',
-        '.kt': 'Kotlin',
-        '.scala': 'Scala',
-        '.r': 'R',
-        '.m': 'MATLAB/Objective-C',
-        '.lua': 'Lua',
-        '.pl': 'Perl',
-        '.sh': 'Shell Script',
-        '.bash': 'Bash',
-        '.html': 'HTML',
-        '.css': 'CSS',
-        '.scss': 'SCSS',
-        '.sass': 'Sass',
-        '.less': 'Less',
-        '.sql': 'SQL',
-        '.vue': 'Vue.js',
-        '.svelte': 'Svelte',
-        '.dart': 'Dart',
-        '.xml': 'XML',
-        '.json': 'JSON',
-        '.yaml': 'YAML',
-        '.yml': 'YAML',
-        '.md': 'Markdown',
-        '.tex': 'LaTeX'
+        'doc_files': [],
+        '_root': str(project_path),
+        '_source_files': []
     }
     
-    # Comprehensive dependency/config files
-    dependency_files = {
-        'requirements.txt': 'Python',
-        'setup.py': 'Python',
-        'pyproject.toml': 'Python',
-        'Pipfile': 'Python',
-        'environment.yml': 'Conda',
-        'package.json': 'Node.js',
-        'package-lock.json': 'Node.js',
-        'yarn.lock': 'Yarn',
-        'pnpm-lock.yaml': 'pnpm',
-        'Gemfile': 'Ruby',
-        'Gemfile.lock': 'Ruby',
-        'pom.xml': 'Maven (Java)',
-        'build.gradle': 'Gradle (Java)',
-        'Cargo.toml': 'Rust',
-        'go.mod': 'Go',
-        'go.sum': 'Go',
-        'composer.json': 'PHP',
-        'Podfile': 'iOS/CocoaPods',
-        'pubspec.yaml': 'Dart/Flutter'
-    }
-    
-    config_files = [
-        '.gitignore', '.dockerignore', 'Dockerfile', 'docker-compose.yml',
-        '.env.example', '.eslintrc', '.prettierrc', 'tsconfig.json',
-        'webpack.config.js', 'vite.config.js', '.babelrc', 'jest.config.js',
-        'pytest.ini', 'tox.ini', '.flake8', 'mypy.ini', 'setup.cfg'
-    ]
-    
-    # Scan project directory
-    for item in project_path.rglob('*'):
-        # Skip common ignore folders
-        if any(part in ['.git', 'node_modules', '__pycache__', 'venv', '.venv', 
-                       'dist', 'build', 'target', '.idea', '.vscode', 'coverage'] 
-               for part in item.parts):
+    # Scan project directory depth-first, never descending into ignored folders
+    root = analysis['_root']
+    pending = deque([(root, None)])
+    top_level_files = []
+    top_dir_file_counts = {}
+    files_to_count = []
+    file_types = defaultdict(int)
+    
+    while pending:
+        current, top_dir = pending.pop()
+        parent_name = os.path.basename(current).lower()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
             continue
         
-        if item.is_file():
+        for entry in entries:
+            name = entry.name
+            
+            if entry.is_dir(follow_symlinks=False):
+                if name in IGNORE_DIRS:
+                    continue
+                if top_dir is None:
+                    analysis['directories'].append(name)
+                    top_dir_file_counts[name] = 0
+                pending.append((entry.path, top_dir or name))
+                continue
+            
+            if not entry.is_file():
+                continue
+            
             analysis['total_files'] += 1
+            if top_dir is None:
+                top_level_files.append(name)
+            else:
+                top_dir_file_counts[top_dir] += 1
             
-            # Count lines of code
-            try:
-                with open(item, 'r', encoding='utf-8', errors='ignore') as f:
-                    analysis['total_lines'] += sum(1 for _ in f)
-            except:
-                pass
+            name_lower = name.lower()
+            ext = os.path.splitext(name_lower)[1]
+            
+            # Queue sources for line counting (skipping binaries and large
+            # generated files) and for README code samples
+            if ext in _COUNTABLE_EXTS or ext in _SAMPLE_EXTENSIONS:
+                size = entry.stat().st_size
+                if ext in _COUNTABLE_EXTS and size <= _MAX_COUNT_BYTES:
+                    files_to_count.append(entry.path)
+                if ext in _SAMPLE_EXTENSIONS and 100 < size < 10000:
+                    analysis['_source_files'].append((entry.path, size, ext))
             
             # Count file types
-            ext = item.suffix.lower()
             if ext:
-                analysis['file_types'][ext] = analysis['file_types'].get(ext, 0) + 1
+                file_types[ext] += 1
                 
                 # Detect languages
-                if ext in language_map:
-                    analysis['languages'].add(language_map[ext])
+                if ext in LANGUAGE_MAP:
+                    analysis['languages'].add(LANGUAGE_MAP[ext])
             
             # Check for test files
-            if 'test' in item.name.lower() or item.parent.name.lower() in ['tests', 'test', '__tests__']:
+            if 'test' in name_lower or parent_name in ('tests', 'test', '__tests__'):
                 analysis['test_files'] += 1
             
             # Check for documentation
-            if ext in ['.md', '.rst', '.txt'] and item.name.upper() not in ['LICENSE', 'README.MD']:
-                analysis['doc_files'].append(item.name)
-            
-            # Check for dependency files
-            if item.name in dependency_files:
-                analysis['main_files'].append(item.name)
-                extract_dependencies(item, analysis, dependency_files[item.name])
+            if ext in ('.md', '.rst', '.txt') and name_lower not in ('license', 'readme.md'):
+                analysis['doc_files'].append(name)
             
-            # Check for config files
-            if item.name in config_files or item.name.startswith('.env'):
-                analysis['config_files'].append(item.name)
-        
-        elif item.is_dir() and item.parent == project_path:
-            analysis['directories'].append(item.name)
+            # Check for dependency and config files
+            special = _SPECIAL_NAMES.get(name)
+            if special is not None:
+                kind, tech = special
+                if kind == 'dep':
+                    analysis['main_files'].append(name)
+                    extract_dependencies(entry.path, analysis, tech)
+                else:
+                    analysis['config_files'].append(name)
+            elif name[:4] == '.env':
+                analysis['config_files'].append(name)
+    
+    analysis['file_types'] = dict(file_types)
+    
+    # Count lines of code; file reads release the GIL, so threads overlap the I/O
+    if len(files_to_count) >= _PARALLEL_COUNT_MIN_FILES:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        batches = [files_to_count[i:i + _COUNT_BATCH_SIZE]
+                   for i in range(0, len(files_to_count), _COUNT_BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            analysis['total_lines'] = sum(executor.map(_count_lines_batch, batches))
+    else:
+        analysis['total_lines'] = _count_lines_batch(files_to_count)
     
-    # Create structure overview (exclude output files)
-    for item in sorted(project_path.iterdir()):
-        if item.name.startswith('.') or item.name in ['node_modules', '__pycache__', 'venv', '.venv']:
+    # Create structure overview from the walk above (exclude output files)
+    for name in sorted(top_level_files + list(top_dir_file_counts)):
+        if name.startswith('.'):
             continue
         
         # Skip obvious output/scan files
-        if re.match(r'.*_\d{8}_\d{6}\.(csv|json|txt)$', item.name):
+        if _OUTPUT_FILE_RE.search(name):
             continue
         
-        if item.is_dir():
-            file_count = sum(1 for _ in item.rglob('*') if _.is_file() and 
-                           not any(x in _.parts for x in ['node_modules', '__pycache__', 'venv']))
-            analysis['structure'].append(f"{item.name}/ ({file_count} files)")
+        if name in top_dir_file_counts:
+            analysis['structure'].append(f"{name}/ ({top_dir_file_counts[name]} files)")
         else:
-            analysis['structure'].append(item.name)
+            analysis['structure'].append(name)
     
     analysis['languages'] = sorted(list(analysis['languages']))
     
     return analysis
 
 
-def extract_dependencies(file_path: Path, analysis: Dict, tech: str) -> None:
+def _match_lines(file_path: str, pattern: re.Pattern, limit: int = 15) -> List[str]:
+    """Collect the first group of up to `limit` pattern matches, streaming the file by line."""
+    deps = []
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            for match in pattern.finditer(line):
+                deps.append(match.group(1))
+                if len(deps) >= limit:
+                    return deps
+    return deps
+
+
+def extract_dependencies(file_path: str, analysis: Dict, tech: str) -> None:
     """Extract dependencies from various dependency files."""
+    name = os.path.basename(file_path)
     try:
-        if file_path.name == 'requirements.txt':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                deps = [line.strip().split('==')[0].split('>=')[0].split('~=')[0] 
-                       for line in f if line.strip() and not line.startswith('#')]
-                analysis['dependencies'][tech] = deps[:15]
+        if name == 'requirements.txt':
+            content = Path(file_path).read_text(encoding='utf-8', errors='ignore')
+            deps = [line.strip().split('==')[0].split('>=')[0].split('~=')[0] 
+                   for line in content.splitlines() if line.strip() and not line.startswith('#')]
+            analysis['dependencies'][tech] = deps[:15]
         
-        elif file_path.name == 'package.json':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
-                analysis['dependencies'][tech] = list(deps.keys())[:15]
-                
-                # Extract scripts
-                if 'scripts' in data:
-                    analysis['npm_scripts'] = data['scripts']
+        elif name == 'package.json':
+            data = _json_loads(Path(file_path).read_bytes())
+            deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
+            analysis['dependencies'][tech] = list(deps.keys())[:15]
+            
+            # Extract scripts
+            if 'scripts' in data:
+                analysis['npm_scripts'] = data['scripts']
         
-        elif file_path.name == 'Cargo.toml':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                deps = re.findall(r'^(\w+)\s*=', content, re.MULTILINE)
-                analysis['dependencies'][tech] = deps[:15]
+        elif name == 'Cargo.toml':
+            analysis['dependencies'][tech] = _match_lines(file_path, _CARGO_DEP_RE)
         
-        elif file_path.name in ['Gemfile', 'pyproject.toml', 'go.mod']:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                if file_path.name == 'pyproject.toml':
-                    deps = re.findall(r'([a-zA-Z0-9_-]+)\s*[=~>]', content)
-                else:
-                    deps = re.findall(r'^\s*(?:gem|require)\s+["\']([^"\']+)', content, re.MULTILINE)
-                analysis['dependencies'][tech] = deps[:15]
+        elif name in ('Gemfile', 'pyproject.toml', 'go.mod'):
+            if name == 'pyproject.toml':
+                pattern = _PYPROJECT_DEP_RE
+            else:
+                pattern = _REQUIRE_DEP_RE
+            analysis['dependencies'][tech] = _match_lines(file_path, pattern)
                 
     except Exception as e:
-        print(f"  ⚠️  Could not parse {file_path.name}: {e}")
+        print(f"  ⚠️  Could not parse {name}: {e}")
 
 
-def read_sample_code(project_path: Path, max_files: int = 3) -> List[Dict]:
+def read_sample_code(analysis: Dict, max_files: int = 3) -> List[Dict]:
     """
-    Reads sample code files from the project.
+    Reads sample code files collected by analyze_project_structure.
+    
+    Main/index/app files rank first, then files are ordered by the extension
+    preference in _SAMPLE_EXTENSIONS.
     """
-    code_samples = []
-    code_extensions = ['.py', '.js', '.jsx', '.ts', '.tsx', '.java', '.cpp', 
-                      '.c', '.go', '.rs', '.rb', '.php', '.vue', '.swift']
+    root = analysis['_root']
+    candidates = sorted(
+        (0 if os.path.splitext(os.path.basename(path))[0] in _SAMPLE_PRIORITY_STEMS else 1,
+         _SAMPLE_EXTENSIONS[ext], path, ext)
+        for path, size, ext in analysis['_source_files']
+    )
     
-    count = 0
-    for ext in code_extensions:
-        if count >= max_files:
-            break
+    code_samples = []
+    for _, _, path, ext in candidates:
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read(1500)
+        except OSError:
+            continue
         
-        for file in project_path.rglob(f'*{ext}'):
-            if any(part in file.parts for part in ['node_modules', '__pycache__', 'venv', '.venv', 'dist', 'build']):
-                continue
-            
-            # Prioritize main/index files
-            if file.stem not in ['main', 'index', 'app'] and count > 0:
-                continue
-            
-            try:
-                with open(file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    if 100 < len(content) < 10000:  # Reasonable file size
-                        code_samples.append({
-                            'filename': file.name,
-                            'relative_path': str(file.relative_to(project_path)),
-                            'language': ext[1:],
-                            'content': content[:1500]
-                        })
-                        count += 1
-                        
-                        if count >= max_files:
-                            break
-            except:
-                continue
+        if content:
+            code_samples.append({
+                'filename': os.path.basename(path),
+                'relative_path': os.path.relpath(path, root),
+                'language': ext[1:],
+                'content': content
+            })
+            if len(code_samples) >= max_files:
+                break
     
     return code_samples
 
 
 def detect_project_type(analysis: Dict) -> str:
     """Detect the type of project based on files and structure."""
-    files = set(analysis['main_files'] + analysis['config_files'])
+    files = set(analysis['main_files'])
+    files.update(analysis['config_files'])
+    
+    # One lowercased pass over every dependency; framework checks below are
+    # substring tests on this string, so their priority order is preserved
+    deps = ' '.join(str(dep).lower() for group in analysis.get('dependencies', {}).values() for dep in group)
     
     if 'package.json' in files:
-        if any('react' in str(dep).lower() for deps in analysis.get('dependencies', {}).values() for dep in deps):
+        if 'react' in deps:
             return 'React Application'
-        elif any('vue' in str(dep).lower() for deps in analysis.get('dependencies', {}).values() for dep in deps):
+        elif 'vue' in deps:
             return 'Vue.js Application'
-        elif any('express' in str(dep).lower() for deps in analysis.get('dependencies', {}).values() for dep in deps):
+        elif 'express' in deps:
             return 'Node.js/Express Backend'
-        elif any('next' in str(dep).lower() for deps in analysis.get('dependencies', {}).values() for dep in deps):
+        elif 'next' in deps:
             return 'Next.js Application'
         return 'Node.js Application'
     
     if 'requirements.txt' in files or 'setup.py' in files or 'pyproject.toml' in files:
-        if any('django' in str(dep).lower() for deps in analysis.get('dependencies', {}).values() for dep in deps):
+        if 'django' in deps:
             return 'Django Application'
-        elif any('flask' in str(dep).lower() for deps in analysis.get('dependencies', {}).values() for dep in deps):
+        elif 'flask' in deps:
             return 'Flask Application'
-        elif any('fastapi' in str(dep).lower() for deps in analysis.get('dependencies', {}).values() for dep in deps):
+        elif 'fastapi' in deps:
             return 'FastAPI Application'
         return 'Python Project'
     
@@ -289,34 +417,39 @@ def load_auto_generated_info(project_path: Path) -> Optional[Dict]:
     """Load automatically generated README info if available."""
     info_file = project_path / 'readme_info.json'
     
-    if info_file.exists():
-        try:
-            with open(info_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return None
-    return None
+    try:
+        info = _json_loads(info_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return info if isinstance(info, dict) else None
 
 
-def get_user_input(project_path: Path) -> Dict:
+def get_user_input(project_path: Path, auto_info: Optional[Dict] = None) -> Dict:
     """
     Prompts user for README details.
     Can use auto-generated information as defaults.
     
+    Args:
+        project_path: Project folder, searched for readme_info.json
+        auto_info: Auto-generated information already in memory; skips the file
+    
     Returns:
         dict: User-provided information
     """
     # Check for auto-generated info
-    auto_info = load_auto_generated_info(project_path)
+    if auto_info is None:
+        auto_info = load_auto_generated_info(project_path)
     
     if auto_info:
-        print("\n" + "=" * 70)
-        print("🤖 AUTO-GENERATED INFO FOUND!".center(70))
-        print("=" * 70)
-        print("\nWould you like to:")
-        print("  1. Use auto-generated information (recommended)")
-        print("  2. Enter information manually")
-        print("  3. Use auto-generated with manual edits")
+        sys.stdout.write(
+            f"\n{'=' * 70}\n"
+            f"{'🤖 AUTO-GENERATED INFO FOUND!'.center(70)}\n"
+            f"{'=' * 70}\n"
+            "\nWould you like to:\n"
+            "  1. Use auto-generated information (recommended)\n"
+            "  2. Enter information manually\n"
+            "  3. Use auto-generated with manual edits\n"
+        )
         
         choice = input("\nYour choice (1-3, default: 1): ").strip() or '1'
         
@@ -326,11 +459,13 @@ def get_user_input(project_path: Path) -> Dict:
         elif choice == '3':
             print("\n✏️  You can press Enter to keep auto-generated values")
     
-    print("\n" + "=" * 70)
-    print("📝 PROJECT INFORMATION".center(70))
-    print("=" * 70)
-    print("\nPlease provide the following details for your README:")
-    print("(Press Enter to skip optional fields)\n")
+    sys.stdout.write(
+        f"\n{'=' * 70}\n"
+        f"{'📝 PROJECT INFORMATION'.center(70)}\n"
+        f"{'=' * 70}\n"
+        "\nPlease provide the following details for your README:\n"
+        "(Press Enter to skip optional fields)\n\n"
+    )
     
     user_data = {}
     
@@ -367,12 +502,14 @@ def get_user_input(project_path: Path) -> Dict:
     user_data['repo_name'] = input("\n🔗 GitHub repository name (optional): ").strip()
     
     # License
-    print("\n📄 License:")
-    print("   1. MIT")
-    print("   2. Apache 2.0")
-    print("   3. GPL-3.0")
-    print("   4. BSD-3-Clause")
-    print("   5. Other/None")
+    sys.stdout.write(
+        "\n📄 License:\n"
+        "   1. MIT\n"
+        "   2. Apache 2.0\n"
+        "   3. GPL-3.0\n"
+        "   4. BSD-3-Clause\n"
+        "   5. Other/None\n"
+    )
     license_choice = input("   Choose license (1-5, default: 1): ").strip()
     
     license_map = {
@@ -395,38 +532,40 @@ def get_user_input(project_path: Path) -> Dict:
     return user_data
 
 
-def generate_readme_content(analysis: Dict, code_samples: List[Dict], user_data: Dict) -> str:
+def generate_readme_content(analysis: Dict, code_samples: List[Dict], user_data: Dict,
+                            project_type: Optional[str] = None) -> str:
     """
     Generates comprehensive README content based on project analysis and user input.
     """
-    project_type = detect_project_type(analysis)
+    if project_type is None:
+        project_type = detect_project_type(analysis)
     project_name = analysis['project_name']
     
     # Build README
-    readme = f"# {project_name}\n\n"
+    parts = [f"# {project_name}\n\n"]
     
     # Add description
     if user_data.get('description'):
-        readme += f"> {user_data['description']}\n\n"
+        parts.append(f"> {user_data['description']}\n\n")
     
     # Badges
-    readme += "[![License](https://img.shields.io/badge/License-{license}-blue.svg)](LICENSE)\n".format(
-        license=user_data.get('license', 'MIT').replace('-', '--'))
+    parts.append("[![License](https://img.shields.io/badge/License-{license}-blue.svg)](LICENSE)\n".format(
+        license=user_data.get('license', 'MIT').replace('-', '--')))
     
     if user_data.get('github_username') and user_data.get('repo_name'):
         repo = user_data['repo_name']
         username = user_data['github_username']
-        readme += f"[![GitHub Stars](https://img.shields.io/github/stars/{username}/{repo}?style=social)](https://github.com/{username}/{repo})\n"
+        parts.append(f"[![GitHub Stars](https://img.shields.io/github/stars/{username}/{repo}?style=social)](https://github.com/{username}/{repo})\n")
     
     if 'Python' in analysis['languages']:
-        readme += "![Python](https://img.shields.io/badge/Python-3.x-blue.svg)\n"
+        parts.append("![Python](https://img.shields.io/badge/Python-3.x-blue.svg)\n")
     if any(lang in analysis['languages'] for lang in ['JavaScript', 'React (JSX)', 'TypeScript']):
-        readme += "![JavaScript](https://img.shields.io/badge/JavaScript-ES6+-yellow.svg)\n"
+        parts.append("![JavaScript](https://img.shields.io/badge/JavaScript-ES6+-yellow.svg)\n")
     
-    readme += "\n"
+    parts.append("\n")
     
     # Table of Contents
-    readme += """## 📑 Table of Contents
+    parts.append("""## 📑 Table of Contents
 
 - [Overview](#overview)
 - [Features](#features)
@@ -434,71 +573,69 @@ def generate_readme_content(analysis: Dict, code_samples: List[Dict], user_data:
 - [Installation](#installation)
 - [Usage](#usage)
 - [Project Structure](#project-structure)
-"""
+""")
     
     if code_samples:
-        readme += "- [Code Examples](#code-examples)\n"
+        parts.append("- [Code Examples](#code-examples)\n")
     if analysis['dependencies']:
-        readme += "- [Dependencies](#dependencies)\n"
+        parts.append("- [Dependencies](#dependencies)\n")
     
-    readme += """- [Contributing](#contributing)
+    parts.append("""- [Contributing](#contributing)
 - [License](#license)
 - [Contact](#contact)
 
-"""
+""")
     
     # Overview
-    readme += "## 📊 Overview\n\n"
+    parts.append("## 📊 Overview\n\n")
     if user_data.get('description'):
-        readme += f"{user_data['description']}\n\n"
+        parts.append(f"{user_data['description']}\n\n")
     
-    readme += f"This {project_type.lower()} contains **{analysis['total_files']} files** "
-    readme += f"with approximately **{analysis['total_lines']:,} lines of code**.\n\n"
+    parts.append(f"This {project_type.lower()} contains **{analysis['total_files']} files** ")
+    parts.append(f"with approximately **{analysis['total_lines']:,} lines of code**.\n\n")
     
     # Screenshots
     if user_data.get('has_screenshots'):
-        readme += "### 📸 Screenshots\n\n"
+        parts.append("### 📸 Screenshots\n\n")
         if user_data.get('screenshot_note'):
-            readme += f"![Screenshot]({user_data['screenshot_note']})\n\n"
+            parts.append(f"![Screenshot]({user_data['screenshot_note']})\n\n")
         else:
-            readme += "<!-- Add your screenshots here -->\n"
-            readme += "![Screenshot](path/to/screenshot.png)\n\n"
+            parts.append("<!-- Add your screenshots here -->\n")
+            parts.append("![Screenshot](path/to/screenshot.png)\n\n")
     
     # Features
-    readme += "## ✨ Features\n\n"
+    parts.append("## ✨ Features\n\n")
     if user_data.get('features'):
-        for feature in user_data['features']:
-            readme += f"- ✅ {feature}\n"
+        parts.extend(f"- ✅ {feature}\n" for feature in user_data['features'])
     else:
-        readme += "- Feature 1: Describe your main feature\n"
-        readme += "- Feature 2: Another key feature\n"
-        readme += "- Feature 3: Additional functionality\n"
-    readme += "\n"
+        parts.append("- Feature 1: Describe your main feature\n")
+        parts.append("- Feature 2: Another key feature\n")
+        parts.append("- Feature 3: Additional functionality\n")
+    parts.append("\n")
     
     # Technologies
     if analysis['languages']:
-        readme += "## 🛠️ Technologies Used\n\n"
-        for lang in analysis['languages']:
-            readme += f"- **{lang}**\n"
-        readme += "\n"
+        parts.append("## 🛠️ Technologies Used\n\n")
+        parts.extend(f"- **{lang}**\n" for lang in analysis['languages'])
+        parts.append("\n")
     
     # Installation
-    readme += "## 🚀 Installation\n\n"
-    readme += "### Prerequisites\n\n"
+    parts.append("## 🚀 Installation\n\n")
+    parts.append("### Prerequisites\n\n")
     
     if 'Python' in analysis['languages']:
-        readme += "- Python 3.8 or higher\n"
+        parts.append("- Python 3.8 or higher\n")
     if any(lang in analysis['languages'] for lang in ['JavaScript', 'TypeScript', 'React (JSX)']):
-        readme += "- Node.js 14.x or higher\n"
+        parts.append("- Node.js 14.x or higher\n")
     if 'Rust' in analysis['languages']:
-        readme += "- Rust 1.60 or higher\n"
+        parts.append("- Rust 1.60 or higher\n")
     if 'Go' in analysis['languages']:
-        readme += "- Go 1.18 or higher\n"
+        parts.append("- Go 1.18 or higher\n")
     
     if user_data.get('install_notes'):
-        readme += f"- {user_data['install_notes']}\n"
+        parts.append(f"- {user_data['install_notes']}\n")
     
-    readme += "\n### Setup\n\n"
+    parts.append("\n### Setup\n\n")
     
     # Repository clone
     if user_data.get('github_username') and user_data.get('repo_name'):
@@ -506,16 +643,16 @@ def generate_readme_content(analysis: Dict, code_samples: List[Dict], user_data:
     else:
         repo_url = f"https://github.com/yourusername/{project_name}.git"
     
-    readme += f"""1. Clone the repository:
+    parts.append(f"""1. Clone the repository:
 ```bash
 git clone {repo_url}
 cd {project_name}
 ```
 
-"""
+""")
     
     if 'requirements.txt' in analysis['main_files']:
-        readme += """2. Create a virtual environment (recommended):
+        parts.append("""2. Create a virtual environment (recommended):
 ```bash
 python -m venv venv
 source venv/bin/activate  # On Windows: venv\\Scripts\\activate
@@ -526,67 +663,65 @@ source venv/bin/activate  # On Windows: venv\\Scripts\\activate
 pip install -r requirements.txt
 ```
 
-"""
+""")
     
     if 'package.json' in analysis['main_files']:
-        readme += """2. Install dependencies:
+        parts.append("""2. Install dependencies:
 ```bash
 npm install
 # or
 yarn install
 ```
 
-"""
+""")
     
     # Usage
-    readme += "## 💻 Usage\n\n"
+    parts.append("## 💻 Usage\n\n")
     
     if user_data.get('run_command'):
-        readme += f"Run the project:\n\n```bash\n{user_data['run_command']}\n```\n\n"
+        parts.append(f"Run the project:\n\n```bash\n{user_data['run_command']}\n```\n\n")
     
     if user_data.get('additional_usage'):
-        readme += f"{user_data['additional_usage']}\n\n"
+        parts.append(f"{user_data['additional_usage']}\n\n")
     
     if analysis.get('npm_scripts'):
-        readme += "### Available Scripts\n\n"
+        parts.append("### Available Scripts\n\n")
         for script, command in list(analysis['npm_scripts'].items())[:5]:
-            readme += f"- `npm run {script}` - {command}\n"
-        readme += "\n"
+            parts.append(f"- `npm run {script}` - {command}\n")
+        parts.append("\n")
     
     # Project structure
     if analysis['structure']:
-        readme += "## 📁 Project Structure\n\n```\n"
-        readme += f"{project_name}/\n"
-        for item in analysis['structure'][:15]:
-            readme += f"├── {item}\n"
+        parts.append("## 📁 Project Structure\n\n```\n")
+        parts.append(f"{project_name}/\n")
+        parts.extend(f"├── {item}\n" for item in analysis['structure'][:15])
         if len(analysis['structure']) > 15:
-            readme += f"└── ...and {len(analysis['structure']) - 15} more\n"
-        readme += "```\n\n"
+            parts.append(f"└── ...and {len(analysis['structure']) - 15} more\n")
+        parts.append("```\n\n")
     
     # Code examples
     if code_samples:
-        readme += "## 📝 Code Examples\n\n"
+        parts.append("## 📝 Code Examples\n\n")
         for sample in code_samples[:2]:
-            readme += f"### `{sample['relative_path']}`\n\n"
-            readme += f"```{sample['language']}\n{sample['content'][:600]}\n"
+            parts.append(f"### `{sample['relative_path']}`\n\n")
+            parts.append(f"```{sample['language']}\n{sample['content'][:600]}\n")
             if len(sample['content']) > 600:
-                readme += "# ...\n"
-            readme += "```\n\n"
+                parts.append("# ...\n")
+            parts.append("```\n\n")
     
     # Dependencies
     if analysis['dependencies']:
-        readme += "## 📦 Dependencies\n\n"
+        parts.append("## 📦 Dependencies\n\n")
         for tech, deps in analysis['dependencies'].items():
-            readme += f"### {tech}\n\n"
-            for dep in deps[:10]:
-                readme += f"- `{dep}`\n"
+            parts.append(f"### {tech}\n\n")
+            parts.extend(f"- `{dep}`\n" for dep in deps[:10])
             if len(deps) > 10:
-                readme += f"- *...and {len(deps) - 10} more*\n"
-            readme += "\n"
+                parts.append(f"- *...and {len(deps) - 10} more*\n")
+            parts.append("\n")
     
     # Testing
     if analysis['test_files'] > 0:
-        readme += f"""## 🧪 Testing
+        parts.append(f"""## 🧪 Testing
 
 This project includes **{analysis['test_files']} test file(s)**.
 
@@ -597,10 +732,10 @@ pytest  # For Python
 npm test  # For Node.js
 ```
 
-"""
+""")
     
     # Contributing
-    readme += """## 🤝 Contributing
+    parts.append("""## 🤝 Contributing
 
 Contributions are welcome! Here's how you can help:
 
@@ -612,52 +747,57 @@ Contributions are welcome! Here's how you can help:
 
 Please make sure to update tests as appropriate and follow the existing code style.
 
-"""
+""")
     
     # License
-    readme += f"""## 📄 License
+    parts.append(f"""## 📄 License
 
 This project is licensed under the {user_data.get('license', 'MIT')} License - see the [LICENSE](LICENSE) file for details.
 
-"""
+""")
     
     # Contact
-    readme += f"""## 👤 Contact
+    parts.append(f"""## 👤 Contact
 
 **{user_data.get('author_name', 'Your Name')}**
 
 - GitHub: [@{user_data.get('github_username', 'yourusername')}](https://github.com/{user_data.get('github_username', 'yourusername')})
-"""
+""")
     
     if user_data.get('email'):
-        readme += f"- Email: {user_data['email']}\n"
+        parts.append(f"- Email: {user_data['email']}\n")
     
-    readme += "\n"
+    parts.append("\n")
     
     # Acknowledgments
     if user_data.get('acknowledgments'):
-        readme += f"""## 🙏 Acknowledgments
+        parts.append(f"""## 🙏 Acknowledgments
 
 {user_data['acknowledgments']}
 
-"""
+""")
     
     # Support
-    readme += """## ⭐ Show your support
+    parts.append("""## ⭐ Show your support
 
 Give a ⭐️ if this project helped you!
 
-"""
+""")
     
-    readme += f"\n---\n\n*📅 Generated on {datetime.now().strftime('%B %d, %Y')}*\n"
+    parts.append(f"\n---\n\n*📅 Generated on {datetime.now().strftime('%B %d, %Y')}*\n")
     
-    return readme
+    return ''.join(parts)
 
 
 def create_readme(project_path: str, output_file: str = 'README.md', 
-                 include_samples: bool = True, interactive: bool = True) -> Optional[Path]:
+                 include_samples: bool = True, interactive: bool = True,
+                 auto_info: Optional[Dict] = None,
+                 prompt_user: Callable[[Path, Optional[Dict]], Dict] = get_user_input) -> Optional[Path]:
     """
     Main function to analyze project and create README.
+    
+    Args:
+        prompt_user: Collects the project details in interactive mode
     """
     project_path = Path(project_path).resolve()
     
@@ -669,37 +809,44 @@ def create_readme(project_path: str, output_file: str = 'README.md',
         print(f"❌ Error: '{project_path}' is not a directory.")
         return None
     
-    print("\n" + "=" * 70)
-    print("📚 README GENERATOR".center(70))
-    print("=" * 70)
-    print(f"\n🔍 Analyzing project: {project_path.name}")
-    print("-" * 70)
+    sys.stdout.write(
+        f"\n{'=' * 70}\n"
+        f"{'📚 README GENERATOR'.center(70)}\n"
+        f"{'=' * 70}\n"
+        f"\n🔍 Analyzing project: {project_path.name}\n"
+        f"{'-' * 70}\n"
+    )
     
     # Analyze project
     print("📊 Analyzing project structure...")
     analysis = analyze_project_structure(project_path)
     
-    print(f"  ✓ Found {analysis['total_files']} files")
-    print(f"  ✓ Total lines of code: {analysis['total_lines']:,}")
-    print(f"  ✓ Detected languages: {', '.join(analysis['languages']) if analysis['languages'] else 'None detected'}")
-    print(f"  ✓ Configuration files: {len(analysis['config_files'])}")
-    print(f"  ✓ Test files: {analysis['test_files']}")
+    sys.stdout.write(
+        f"  ✓ Found {analysis['total_files']} files\n"
+        f"  ✓ Total lines of code: {analysis['total_lines']:,}\n"
+        f"  ✓ Detected languages: {', '.join(analysis['languages']) if analysis['languages'] else 'None detected'}\n"
+        f"  ✓ Configuration files: {len(analysis['config_files'])}\n"
+        f"  ✓ Test files: {analysis['test_files']}\n"
+    )
     
     # Read sample code
     code_samples = []
     if include_samples:
         print("\n📄 Reading sample code files...")
-        code_samples = read_sample_code(project_path)
+        code_samples = read_sample_code(analysis)
         print(f"  ✓ Collected {len(code_samples)} code samples")
     
     # Get user input
     user_data = {}
     if interactive:
-        user_data = get_user_input()
+        user_data = prompt_user(project_path, auto_info)
+    elif auto_info:
+        user_data = auto_info
     
     # Generate README
     print("\n✍️  Generating README content...")
-    readme_content = generate_readme_content(analysis, code_samples, user_data)
+    project_type = detect_project_type(analysis)
+    readme_content = generate_readme_content(analysis, code_samples, user_data, project_type)
     
     # Save README
     output_path = project_path / output_file
@@ -721,40 +868,56 @@ def create_readme(project_path: str, output_file: str = 'README.md',
         print(f"\n❌ Error writing README: {e}")
         return None
     
-    print(f"\n✅ README.md created successfully!")
-    print("-" * 70)
-    print("\n📋 Summary:")
-    print(f"  • Project: {analysis['project_name']}")
-    print(f"  • Type: {detect_project_type(analysis)}")
-    print(f"  • Files: {analysis['total_files']}")
-    print(f"  • Lines of code: {analysis['total_lines']:,}")
-    print(f"  • Languages: {', '.join(analysis['languages']) if analysis['languages'] else 'None'}")
-    print(f"  • Output: {output_path}")
-    print("\n💡 Next steps:")
-    print("  1. Review the generated README")
-    print("  2. Add screenshots if you mentioned them")
-    print("  3. Update any placeholder text")
-    print("  4. Commit and push to your repository")
-    print("\n" + "=" * 70 + "\n")
+    sys.stdout.write(
+        "\n✅ README.md created successfully!\n"
+        f"{'-' * 70}\n"
+        "\n📋 Summary:\n"
+        f"  • Project: {analysis['project_name']}\n"
+        f"  • Type: {project_type}\n"
+        f"  • Files: {analysis['total_files']}\n"
+        f"  • Lines of code: {analysis['total_lines']:,}\n"
+        f"  • Languages: {', '.join(analysis['languages']) if analysis['languages'] else 'None'}\n"
+        f"  • Output: {output_path}\n"
+        "\n💡 Next steps:\n"
+        "  1. Review the generated README\n"
+        "  2. Add screenshots if you mentioned them\n"
+        "  3. Update any placeholder text\n"
+        "  4. Commit and push to your repository\n"
+        f"\n{'=' * 70}\n\n"
+    )
     
     return output_path
 
 
-if __name__ == "__main__":
-    print("\n" + "=" * 70)
-    print("📚 AUTOMATED README GENERATOR".center(70))
-    print("=" * 70)
-    print("\n✨ This script will:")
-    print("  • Analyze your complete project structure")
-    print("  • Detect programming languages and frameworks")
-    print("  • Extract dependencies and configurations")
-    print("  • Collect project information from you")
-    print("  • Generate a comprehensive, professional README.md")
-    print("\n" + "-" * 70)
+def main(project_folder: Optional[str] = None, auto_info: Optional[Dict] = None) -> Optional[Path]:
+    """
+    Command-line entry point.
+    
+    Args:
+        project_folder: Project to document; asked for interactively when omitted
+        auto_info: Auto-generated information to offer instead of reading readme_info.json
+    
+    Returns:
+        Path: The written README, or None if nothing was generated
+    """
+    sys.stdout.write(
+        f"\n{'=' * 70}\n"
+        f"{'📚 AUTOMATED README GENERATOR'.center(70)}\n"
+        f"{'=' * 70}\n"
+        "\n✨ This script will:\n"
+        "  • Analyze your complete project structure\n"
+        "  • Detect programming languages and frameworks\n"
+        "  • Extract dependencies and configurations\n"
+        "  • Collect project information from you\n"
+        "  • Generate a comprehensive, professional README.md\n"
+        f"\n{'-' * 70}\n"
+    )
     
     # Interactive mode
-    project_folder = input("\n📂 Enter the path to your project folder: ").strip()
+    if project_folder is None:
+        project_folder = input("\n📂 Enter the path to your project folder: ").strip()
     
+    result = None
     if not project_folder:
         print("❌ No path provided. Exiting.")
     else:
@@ -766,9 +929,16 @@ if __name__ == "__main__":
         include_code = input("Include code samples in README? (Y/n): ").strip().lower() != 'n'
         interactive = input("Enter project details interactively? (Y/n): ").strip().lower() != 'n'
         
-        result = create_readme(project_folder, include_samples=include_code, interactive=interactive)
+        result = create_readme(project_folder, include_samples=include_code, interactive=interactive,
+                               auto_info=auto_info)
         
         if result:
             print(f"🎉 Success! Your README is ready at: {result}")
         else:
-            print("❌ README generation failed. Please check the errors above.")
\ No newline at end of file
+            print("❌ README generation failed. Please check the errors above.")
+    
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -3,49 +3,216 @@ Complete README Generation Workflow
 Automatically analyzes project and generates README with minimal user input.
 """
 
+import os
 import sys
-import subprocess
+import json
+import argparse
+import hashlib
+import tempfile
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
-def run_workflow():
-    """Run the complete README generation workflow."""
+# Both steps run in this interpreter; a missing script only disables its step
+try:
+    from auto_readme_info import main as analyze
+except ImportError:
+    analyze = None
+
+try:
+    from readme_generator import main as generate, create_readme
+except ImportError:
+    generate = create_readme = None
+
+# Banners printed by run_workflow, built once at import
+_RULE = "=" * 80
+_BANNER_HEADER = (
+    f"\n{_RULE}\n"
+    f"{'🚀 COMPLETE README GENERATION WORKFLOW'.center(80)}\n"
+    f"{_RULE}\n"
+    "\nThis workflow will:\n"
+    "  1️⃣  Auto-analyze your project (auto_readme_info.py)\n"
+    "  2️⃣  Generate a professional README (readme_generator.py)\n"
+    f"\n{'-' * 80}\n"
+)
+_BANNER_STEP1 = f"\n{_RULE}\n{'STEP 1: AUTO-ANALYZING PROJECT'.center(80)}\n{_RULE}\n"
+_BANNER_STEP2 = f"\n{_RULE}\n{'STEP 2: GENERATING README'.center(80)}\n{_RULE}\n"
+_BANNER_DONE = (
+    f"\n{_RULE}\n"
+    f"{'✅ WORKFLOW COMPLETE!'.center(80)}\n"
+    f"{_RULE}\n"
+    "\nYour README.md should now be ready!\n"
+    "Check your project folder for the generated README.\n\n"
+)
+
+# Step 1 results are kept here, one file per project folder
+_CACHE_DIR = Path.home() / '.cache' / 'readme-generator'
+
+# Directories whose contents never affect the analysis
+_FINGERPRINT_SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', 'venv', '.venv'})
+
+# Git metadata the analysis reads (author, remote) even though .git is skipped
+_FINGERPRINT_GIT_FILES = ('config', 'HEAD')
+
+
+def _is_workflow_output(name: str) -> bool:
+    """Files written by step 2, left out of the fingerprint."""
+    return name == 'README.md' or name.startswith('README.backup.')
+
+
+def _project_inputs(project_path: Path) -> Dict[str, Tuple[int, int]]:
+    """
+    Collect every file the analysis could look at, including readme_info.json
+    so hand edits to it count as changes.
     
-    print("\n" + "=" * 80)
-    print("🚀 COMPLETE README GENERATION WORKFLOW".center(80))
-    print("=" * 80)
-    print("\nThis workflow will:")
-    print("  1️⃣  Auto-analyze your project (auto_readme_info.py)")
-    print("  2️⃣  Generate a professional README (readme_generator.py)")
-    print("\n" + "-" * 80)
+    Returns:
+        dict: (mtime_ns, size) keyed by file path
+    """
+    root = str(project_path.resolve())
+    inputs = {}
+    pending = [root]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _FINGERPRINT_SKIP_DIRS:
+                            pending.append(entry.path)
+                    elif entry.is_file() and not (current == root and _is_workflow_output(entry.name)):
+                        st = entry.stat()
+                        inputs[entry.path] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            continue
+    
+    for name in _FINGERPRINT_GIT_FILES:
+        path = os.path.join(root, '.git', name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        inputs[path] = (st.st_mtime_ns, st.st_size)
+    
+    return inputs
+
+
+def _project_fingerprint(project_path: Path, inputs: Dict[str, Tuple[int, int]]) -> Tuple[str, int]:
+    """
+    Hash the path, size and mtime of the collected inputs.
+    
+    Returns:
+        tuple: The fingerprint and the newest mtime_ns among those files
+    """
+    entries = sorted((path, mtime, size) for path, (mtime, size) in inputs.items())
+    newest = max((mtime for _, mtime, _ in entries), default=0)
+    root = str(project_path.resolve())
+    return hashlib.blake2b(repr((root, entries)).encode(), digest_size=16).hexdigest(), newest
+
+
+def _cache_file(project_path: Path) -> Path:
+    """Cache entry for a project, keyed by its resolved folder so reruns overwrite it."""
+    key = hashlib.blake2b(str(project_path.resolve()).encode(), digest_size=16).hexdigest()
+    return _CACHE_DIR / f"{key}.json"
+
+
+def _read_cached_info(cache_file: Path, fingerprint: str) -> Optional[Dict]:
+    """Cached analysis if it was taken with this fingerprint, otherwise None."""
+    try:
+        entry = json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if isinstance(entry, dict) and entry.get('fingerprint') == fingerprint \
+            and isinstance(entry.get('info'), dict):
+        return entry['info']
+    return None
+
+
+def _atomic_write(target: Path, data: bytes) -> bool:
+    """Write data to target through a temporary file and os.replace."""
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        return False
+    return True
+
+
+def run_workflow(project_path: Optional[str] = None, force: bool = False) -> bool:
+    """
+    Run the complete README generation workflow.
+    
+    Args:
+        project_path: Project folder to document; asked for interactively when omitted
+        force: Regenerate even if README.md is already up to date
+    
+    Returns:
+        bool: True if README.md is up to date when the workflow ends
+    """
+    
+    sys.stdout.write(_BANNER_HEADER)
     
     # Get project path
-    project_path = input("\n📂 Enter your project folder path: ").strip().strip('"\'')
+    if project_path is None:
+        project_path = input("\n📂 Enter your project folder path: ")
+    project_path = project_path.strip().strip('"\'')
     
     if not project_path:
         print("❌ No path provided. Exiting.")
-        return
+        return False
     
     project_path = Path(project_path)
     if not project_path.exists():
         print(f"❌ Path does not exist: {project_path}")
-        return
+        return False
+    
+    # Nothing to do when the analysis inputs match the cache and README.md
+    # was written (or edited by hand) after every one of them
+    inputs = _project_inputs(project_path)
+    fingerprint, newest_input_ns = _project_fingerprint(project_path, inputs)
+    cache_file = _cache_file(project_path)
+    cached = _read_cached_info(cache_file, fingerprint)
+    
+    if cached is not None and not force:
+        try:
+            readme_ns = (project_path / 'README.md').stat().st_mtime_ns
+        except OSError:
+            readme_ns = 0
+        if readme_ns > newest_input_ns:
+            print("\n✅ README.md is already up to date with the project (use --force to regenerate)")
+            return True
     
-    print("\n" + "=" * 80)
-    print("STEP 1: AUTO-ANALYZING PROJECT".center(80))
-    print("=" * 80)
+    sys.stdout.write(_BANNER_STEP1)
     
-    # Check if auto_readme_info.py exists
-    auto_script = Path(__file__).parent / 'auto_readme_info.py'
+    # Reuse the cached analysis of an unchanged project; readme_info.json is
+    # part of the fingerprint, so it already holds this analysis
+    info_file = project_path.resolve() / 'readme_info.json'
     
-    if auto_script.exists():
+    # The analysis is handed to step 2 in memory
+    info = None
+    if cached is not None:
+        info = cached
+        print("\n⚡ Project unchanged since the last run, reusing the cached analysis")
+    # Check if auto_readme_info.py is available
+    elif analyze is not None:
         # Run auto-analysis
         try:
-            result = subprocess.run(
-                [sys.executable, str(auto_script)],
-                input=f"{project_path}\ny\n",
-                capture_output=False,
-                text=True
-            )
+            info = analyze(project_path=str(project_path), auto_confirm=True)
+            if info is not None:
+                # Step 1 rewrote readme_info.json; key the entry to its new stamp
+                try:
+                    st = info_file.stat()
+                    inputs[str(info_file)] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    inputs.pop(str(info_file), None)
+                fingerprint, _ = _project_fingerprint(project_path, inputs)
+                entry = {'fingerprint': fingerprint, 'info': info}
+                _atomic_write(cache_file, json.dumps(entry, ensure_ascii=False).encode('utf-8'))
         except Exception as e:
             print(f"⚠️  Could not run auto-analysis: {e}")
             print("   Continuing with manual input...")
@@ -53,29 +220,42 @@ def run_workflow():
         print("⚠️  auto_readme_info.py not found")
         print("   Continuing with manual input...")
     
-    print("\n" + "=" * 80)
-    print("STEP 2: GENERATING README".center(80))
-    print("=" * 80)
+    sys.stdout.write(_BANNER_STEP2)
     
-    # Check if readme_generator.py exists
-    readme_script = Path(__file__).parent / 'readme_generator.py'
-    
-    if readme_script.exists():
+    # Check if readme_generator.py is available
+    result = None
+    if generate is not None:
         print("\n🎯 Running README generator...\n")
         try:
-            subprocess.run([sys.executable, str(readme_script)])
+            if sys.stdin.isatty():
+                result = generate(str(project_path), auto_info=info)
+            else:
+                # No one to answer the prompts: use the analysis as-is
+                result = create_readme(str(project_path), include_samples=True, interactive=False,
+                                       auto_info=info)
         except Exception as e:
             print(f"❌ Error running README generator: {e}")
     else:
         print("❌ readme_generator.py not found in the same directory")
         print("   Please ensure both scripts are in the same folder.")
     
-    print("\n" + "=" * 80)
-    print("✅ WORKFLOW COMPLETE!".center(80))
-    print("=" * 80)
-    print("\nYour README.md should now be ready!")
-    print("Check your project folder for the generated README.\n")
+    if result is None:
+        sys.stdout.flush()
+        return False
+    
+    sys.stdout.write(_BANNER_DONE)
+    sys.stdout.flush()
+    return True
 
 
 if __name__ == "__main__":
-    run_workflow()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Analyze a project and generate its README.md.")
+    parser.add_argument('--project', help="project folder to document; prompted for when omitted")
+    parser.add_argument('--force', action='store_true', help="regenerate even if README.md is up to date")
+    args = parser.parse_args()
+    
+    # Only prompt when someone is there to answer
+    if args.project is None and not sys.stdin.isatty():
+        parser.error("--project is required when stdin is not a terminal")
+    
+    sys.exit(0 if run_workflow(args.project, force=args.force) else 1)
\ No newline at end of file